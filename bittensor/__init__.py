@@ -16,8 +16,12 @@
 # THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
+import importlib
 import os
+import sys
+import typing
 import warnings
+from types import ModuleType
 
 from rich.console import Console
 from rich.traceback import install
@@ -43,13 +47,13 @@ if (NEST_ASYNCIO_ENV := os.getenv("NEST_ASYNCIO")) in ("1", None):
 __version__ = "7.3.0"
 
 _version_split = __version__.split(".")
-__version_info__ = tuple(int(part) for part in _version_split)
+__version_info__ = tuple(map(int, _version_split))
 _version_int_base = 1000
 assert max(__version_info__) < _version_int_base
 
-__version_as_int__: int = sum(
-    e * (_version_int_base**i) for i, e in enumerate(reversed(__version_info__))
-)
+__version_as_int__: int = (
+    __version_info__[0] * _version_int_base + __version_info__[1]
+) * _version_int_base + __version_info__[2]
 assert __version_as_int__ < 2**31  # fits in int32
 __new_signature_version__ = 360
 
@@ -61,16 +65,6 @@ __use_console__ = True
 install(show_locals=False)
 
 
-def __getattr__(name):
-    if name == "version_split":
-        warnings.warn(
-            "version_split is deprecated and will be removed in future versions. Use __version__ instead.",
-            DeprecationWarning,
-        )
-        return _version_split
-    raise AttributeError(f"module {__name__} has no attribute {name}")
-
-
 def turn_console_off():
     global __use_console__
     global __console__
@@ -92,11 +86,11 @@ turn_console_off()
 
 # Logging helpers.
 def trace(on: bool = True):
-    logging.set_trace(on)
+    _resolve("logging").set_trace(on)
 
 
 def debug(on: bool = True):
-    logging.set_debug(on)
+    _resolve("logging").set_debug(on)
 
 
 # Substrate chain block time (seconds).
@@ -290,89 +284,300 @@ from .errors import (
     UnstakeError,
 )
 
-from substrateinterface import Keypair  # noqa: F401
-from .config import InvalidConfigFile, DefaultConfig, config, T
-from .keyfile import (
-    serialized_keypair_to_keyfile_data,
-    deserialize_keypair_from_keyfile_data,
-    validate_password,
-    ask_password_to_encrypt,
-    keyfile_data_is_encrypted_nacl,
-    keyfile_data_is_encrypted_ansible,
-    keyfile_data_is_encrypted_legacy,
-    keyfile_data_is_encrypted,
-    keyfile_data_encryption_method,
-    legacy_encrypt_keyfile_data,
-    encrypt_keyfile_data,
-    get_coldkey_password_from_environment,
-    decrypt_keyfile_data,
-    keyfile,
-    Mockkeyfile,
-)
-from .wallet import display_mnemonic_msg, wallet
-
-from .utils import (
-    ss58_to_vec_u8,
-    unbiased_topk,
-    version_checking,
-    strtobool,
-    strtobool_with_default,
-    get_explorer_root_url_by_network_from_map,
-    get_explorer_root_url_by_network_from_map,
-    get_explorer_url_for_network,
-    ss58_address_to_bytes,
-    U16_NORMALIZED_FLOAT,
-    U64_NORMALIZED_FLOAT,
-    u8_key_to_ss58,
-    hash,
-    wallet_utils,
-)
+# Type checkers cannot follow the lazy exports below, so they see the eager imports instead.
+if typing.TYPE_CHECKING:
+    from substrateinterface import Keypair  # noqa: F401
+    from .config import InvalidConfigFile, DefaultConfig, config, T
+    from .keyfile import (
+        serialized_keypair_to_keyfile_data,
+        deserialize_keypair_from_keyfile_data,
+        validate_password,
+        ask_password_to_encrypt,
+        keyfile_data_is_encrypted_nacl,
+        keyfile_data_is_encrypted_ansible,
+        keyfile_data_is_encrypted_legacy,
+        keyfile_data_is_encrypted,
+        keyfile_data_encryption_method,
+        legacy_encrypt_keyfile_data,
+        encrypt_keyfile_data,
+        get_coldkey_password_from_environment,
+        decrypt_keyfile_data,
+        keyfile,
+        Mockkeyfile,
+    )
+    from .wallet import display_mnemonic_msg, wallet
+
+    from . import utils
+    from .utils import (
+        ss58_to_vec_u8,
+        unbiased_topk,
+        version_checking,
+        strtobool,
+        strtobool_with_default,
+        get_explorer_root_url_by_network_from_map,
+        get_explorer_url_for_network,
+        ss58_address_to_bytes,
+        U16_NORMALIZED_FLOAT,
+        U64_NORMALIZED_FLOAT,
+        u8_key_to_ss58,
+        hash,
+        wallet_utils,
+    )
+
+    from .utils.balance import Balance as Balance
+    from . import chain_data
+    from .chain_data import (
+        AxonInfo,
+        NeuronInfo,
+        NeuronInfoLite,
+        PrometheusInfo,
+        DelegateInfo,
+        StakeInfo,
+        SubnetInfo,
+        SubnetHyperparameters,
+        IPInfo,
+        ProposalCallData,
+        ProposalVoteData,
+    )
+
+    from . import subtensor as subtensor_module
+    from .subtensor import Subtensor
+    from .subtensor import Subtensor as subtensor
+
+    from .cli import cli as cli, COMMANDS as ALL_COMMANDS
+    from .btlogging import logging
+    from .metagraph import metagraph as metagraph
+    from .threadpool import PriorityThreadPoolExecutor as PriorityThreadPoolExecutor
+
+    from .synapse import TerminalInfo, Synapse
+    from .stream import StreamingSynapse
+    from .tensor import tensor, Tensor
+    from .axon import axon as axon
+    from .dendrite import dendrite as dendrite
+
+    from . import mock
+    from .mock.keyfile_mock import MockKeyfile as MockKeyfile
+    from .mock.subtensor_mock import MockSubtensor as MockSubtensor
+    from .mock.wallet_mock import MockWallet as MockWallet
+
+    from .subnets import SubnetsAPI as SubnetsAPI
+
+    from . import btlogging, commands, constants, extrinsics, stream, subnets
+    from . import synapse, threadpool, types
+
+    configs: list
+    defaults: config
+
+# Public names resolved on first attribute access, mapped to ``(module, attribute)``.
+# An attribute of ``None`` exposes the module itself.
+_LAZY = {
+    "Keypair": ("substrateinterface", "Keypair"),
+    # config
+    "InvalidConfigFile": ("bittensor.config", "InvalidConfigFile"),
+    "DefaultConfig": ("bittensor.config", "DefaultConfig"),
+    "config": ("bittensor.config", "config"),
+    "T": ("bittensor.config", "T"),
+    # keyfile
+    "serialized_keypair_to_keyfile_data": (
+        "bittensor.keyfile",
+        "serialized_keypair_to_keyfile_data",
+    ),
+    "deserialize_keypair_from_keyfile_data": (
+        "bittensor.keyfile",
+        "deserialize_keypair_from_keyfile_data",
+    ),
+    "validate_password": ("bittensor.keyfile", "validate_password"),
+    "ask_password_to_encrypt": ("bittensor.keyfile", "ask_password_to_encrypt"),
+    "keyfile_data_is_encrypted_nacl": (
+        "bittensor.keyfile",
+        "keyfile_data_is_encrypted_nacl",
+    ),
+    "keyfile_data_is_encrypted_ansible": (
+        "bittensor.keyfile",
+        "keyfile_data_is_encrypted_ansible",
+    ),
+    "keyfile_data_is_encrypted_legacy": (
+        "bittensor.keyfile",
+        "keyfile_data_is_encrypted_legacy",
+    ),
+    "keyfile_data_is_encrypted": ("bittensor.keyfile", "keyfile_data_is_encrypted"),
+    "keyfile_data_encryption_method": (
+        "bittensor.keyfile",
+        "keyfile_data_encryption_method",
+    ),
+    "legacy_encrypt_keyfile_data": (
+        "bittensor.keyfile",
+        "legacy_encrypt_keyfile_data",
+    ),
+    "encrypt_keyfile_data": ("bittensor.keyfile", "encrypt_keyfile_data"),
+    "get_coldkey_password_from_environment": (
+        "bittensor.keyfile",
+        "get_coldkey_password_from_environment",
+    ),
+    "decrypt_keyfile_data": ("bittensor.keyfile", "decrypt_keyfile_data"),
+    "keyfile": ("bittensor.keyfile", "keyfile"),
+    "Mockkeyfile": ("bittensor.keyfile", "Mockkeyfile"),
+    # wallet
+    "display_mnemonic_msg": ("bittensor.wallet", "display_mnemonic_msg"),
+    "wallet": ("bittensor.wallet", "wallet"),
+    # utils
+    "utils": ("bittensor.utils", None),
+    "ss58_to_vec_u8": ("bittensor.utils", "ss58_to_vec_u8"),
+    "unbiased_topk": ("bittensor.utils", "unbiased_topk"),
+    "version_checking": ("bittensor.utils", "version_checking"),
+    "strtobool": ("bittensor.utils", "strtobool"),
+    "strtobool_with_default": ("bittensor.utils", "strtobool_with_default"),
+    "get_explorer_root_url_by_network_from_map": (
+        "bittensor.utils",
+        "get_explorer_root_url_by_network_from_map",
+    ),
+    "get_explorer_url_for_network": (
+        "bittensor.utils",
+        "get_explorer_url_for_network",
+    ),
+    "ss58_address_to_bytes": ("bittensor.utils", "ss58_address_to_bytes"),
+    "U16_NORMALIZED_FLOAT": ("bittensor.utils", "U16_NORMALIZED_FLOAT"),
+    "U64_NORMALIZED_FLOAT": ("bittensor.utils", "U64_NORMALIZED_FLOAT"),
+    "u8_key_to_ss58": ("bittensor.utils", "u8_key_to_ss58"),
+    "hash": ("bittensor.utils", "hash"),
+    "wallet_utils": ("bittensor.utils", "wallet_utils"),
+    "Balance": ("bittensor.utils.balance", "Balance"),
+    # chain data
+    "chain_data": ("bittensor.chain_data", None),
+    "AxonInfo": ("bittensor.chain_data", "AxonInfo"),
+    "NeuronInfo": ("bittensor.chain_data", "NeuronInfo"),
+    "NeuronInfoLite": ("bittensor.chain_data", "NeuronInfoLite"),
+    "PrometheusInfo": ("bittensor.chain_data", "PrometheusInfo"),
+    "DelegateInfo": ("bittensor.chain_data", "DelegateInfo"),
+    "StakeInfo": ("bittensor.chain_data", "StakeInfo"),
+    "SubnetInfo": ("bittensor.chain_data", "SubnetInfo"),
+    "SubnetHyperparameters": ("bittensor.chain_data", "SubnetHyperparameters"),
+    "IPInfo": ("bittensor.chain_data", "IPInfo"),
+    "ProposalCallData": ("bittensor.chain_data", "ProposalCallData"),
+    "ProposalVoteData": ("bittensor.chain_data", "ProposalVoteData"),
+    # Allows avoiding name spacing conflicts and continue access to the `subtensor` module with `subtensor_module` name
+    "subtensor_module": ("bittensor.subtensor", None),
+    # Double mapping allows using class `Subtensor` by referencing `bittensor.Subtensor` and `bittensor.subtensor`.
+    # This will be available for a while until we remove reference `bittensor.subtensor`
+    "Subtensor": ("bittensor.subtensor", "Subtensor"),
+    "subtensor": ("bittensor.subtensor", "Subtensor"),
+    "cli": ("bittensor.cli", "cli"),
+    "ALL_COMMANDS": ("bittensor.cli", "COMMANDS"),
+    "logging": ("bittensor.btlogging", "logging"),
+    "metagraph": ("bittensor.metagraph", "metagraph"),
+    "PriorityThreadPoolExecutor": (
+        "bittensor.threadpool",
+        "PriorityThreadPoolExecutor",
+    ),
+    "TerminalInfo": ("bittensor.synapse", "TerminalInfo"),
+    "Synapse": ("bittensor.synapse", "Synapse"),
+    "StreamingSynapse": ("bittensor.stream", "StreamingSynapse"),
+    "tensor": ("bittensor.tensor", "tensor"),
+    "Tensor": ("bittensor.tensor", "Tensor"),
+    "axon": ("bittensor.axon", "axon"),
+    "dendrite": ("bittensor.dendrite", "dendrite"),
+    "mock": ("bittensor.mock", None),
+    "MockKeyfile": ("bittensor.mock.keyfile_mock", "MockKeyfile"),
+    "MockSubtensor": ("bittensor.mock.subtensor_mock", "MockSubtensor"),
+    "MockWallet": ("bittensor.mock.wallet_mock", "MockWallet"),
+    "SubnetsAPI": ("bittensor.subnets", "SubnetsAPI"),
+    # submodules that were bound on the package by the eager imports
+    "btlogging": ("bittensor.btlogging", None),
+    "commands": ("bittensor.commands", None),
+    "constants": ("bittensor.constants", None),
+    "extrinsics": ("bittensor.extrinsics", None),
+    "stream": ("bittensor.stream", None),
+    "subnets": ("bittensor.subnets", None),
+    "synapse": ("bittensor.synapse", None),
+    "threadpool": ("bittensor.threadpool", None),
+    "types": ("bittensor.types", None),
+}
+
 
-from .utils.balance import Balance as Balance
-from .chain_data import (
-    AxonInfo,
-    NeuronInfo,
-    NeuronInfoLite,
-    PrometheusInfo,
-    DelegateInfo,
-    StakeInfo,
-    SubnetInfo,
-    SubnetHyperparameters,
-    IPInfo,
-    ProposalCallData,
-    ProposalVoteData,
+def __getattr__(name):
+    if name == "version_split":
+        warnings.warn(
+            "version_split is deprecated and will be removed in future versions. Use __version__ instead.",
+            DeprecationWarning,
+        )
+        return _version_split
+    if name == "configs":
+        value = globals()["configs"] = _build_configs()
+        return value
+    if name == "defaults":
+        configs = _resolve("configs")
+        value = globals()["defaults"] = _load("config").merge_all(configs)
+        return value
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__} has no attribute {name}")
+    value = globals()[name] = _load(name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY, "configs", "defaults"})
+
+
+def _resolve(name):
+    """Looks ``name`` up on the module, importing it only if it is not bound yet.
+
+    Unlike calling ``__getattr__`` directly this never rebinds a name that is already
+    set, e.g. one replaced by ``mock.patch``.
+    """
+    return getattr(sys.modules[__name__], name)
+
+
+def _load(name):
+    """Imports the lazy export ``name`` without binding it onto the module."""
+    module_name, attr = _LAZY[name]
+    module = importlib.import_module(module_name)
+    return module if attr is None else getattr(module, attr)
+
+
+def _build_configs() -> list:
+    """Collects the default configs of the core modules, built on first access to ``configs``.
+
+    The real classes are used even when the exported names have been patched, so the
+    defaults match what an eager import would have built.
+    """
+    return [
+        _load("axon").config(),
+        _load("subtensor").config(),
+        _load("PriorityThreadPoolExecutor").config(),
+        _load("wallet").config(),
+        _load("logging").get_config(),
+    ]
+
+
+class _BittensorModule(ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it onto the package, which would shadow the
+        # lazily exported object of the same name (e.g. the ``axon`` class).
+        if (
+            name in _LAZY
+            and isinstance(value, ModuleType)
+            and _LAZY[name][1] is not None
+            and value.__name__ == f"{__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _BittensorModule
+
+# Lazy names are only bound once accessed, so ``from bittensor import *`` needs them listed.
+__all__ = sorted(
+    {
+        name
+        for name, value in globals().items()
+        if not name.startswith("_") and not isinstance(value, ModuleType)
+    }
+    | set(_LAZY)
+    | {"configs", "defaults"}
 )
 
-# Allows avoiding name spacing conflicts and continue access to the `subtensor` module with `subtensor_module` name
-from . import subtensor as subtensor_module
-
-# Double import allows using class `Subtensor` by referencing `bittensor.Subtensor` and `bittensor.subtensor`.
-# This will be available for a while until we remove reference `bittensor.subtensor`
-from .subtensor import Subtensor
-from .subtensor import Subtensor as subtensor
-
-from .cli import cli as cli, COMMANDS as ALL_COMMANDS
-from .btlogging import logging
-from .metagraph import metagraph as metagraph
-from .threadpool import PriorityThreadPoolExecutor as PriorityThreadPoolExecutor
-
-from .synapse import TerminalInfo, Synapse
-from .stream import StreamingSynapse
-from .tensor import tensor, Tensor
-from .axon import axon as axon
-from .dendrite import dendrite as dendrite
-
-from .mock.keyfile_mock import MockKeyfile as MockKeyfile
-from .mock.subtensor_mock import MockSubtensor as MockSubtensor
-from .mock.wallet_mock import MockWallet as MockWallet
-
-from .subnets import SubnetsAPI as SubnetsAPI
-
-configs = [
-    axon.config(),
-    subtensor.config(),
-    PriorityThreadPoolExecutor.config(),
-    wallet.config(),
-    logging.get_config(),
-]
-defaults = config.merge_all(configs)
+# Resolve every lazy name up front, e.g. in CI to catch broken deferred imports.
+if os.getenv("BITTENSOR_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        _resolve(_name)
+    _resolve("defaults")
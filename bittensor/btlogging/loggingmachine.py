@@ -333,6 +333,7 @@ class LoggingMachine(StateMachine):
             logger.setLevel(stdlogging.CRITICAL)
 
     # Required API support log commands for API backwards compatibility.
+    # Each wrapper checks the level first so disabled calls skip building the message.
     @property
     def __trace_on__(self) -> bool:
         """
@@ -345,41 +346,57 @@ class LoggingMachine(StateMachine):
 
     def trace(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps trace message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.TRACE):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.trace(msg, *args, **kwargs)
 
     def debug(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps debug message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.DEBUG):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.debug(msg, *args, **kwargs)
 
     def info(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps info message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.INFO):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.info(msg, *args, **kwargs)
 
     def success(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps success message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.SUCCESS):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.success(msg, *args, **kwargs)
 
     def warning(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps warning message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.WARNING):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.warning(msg, *args, **kwargs)
 
     def error(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps error message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.ERROR):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.error(msg, *args, **kwargs)
 
     def critical(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps critical message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.CRITICAL):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.critical(msg, *args, **kwargs)
 
     def exception(self, msg="", prefix="", suffix="", *args, **kwargs):
         """Wraps exception message with prefix and suffix."""
+        if not self._logger.isEnabledFor(stdlogging.ERROR):
+            return
         msg = f"{prefix} - {msg} - {suffix}"
         self._logger.exception(msg, *args, **kwargs)
 
@@ -249,9 +249,7 @@ class ProposalsCommand:
         )
         table.show_footer = True
 
-        for hash in proposals:
-            call_data, vote_data = proposals[hash]
-
+        for hash, (call_data, vote_data) in proposals.items():
             table.add_row(
                 hash,
                 str(vote_data["threshold"]),
@@ -698,19 +698,16 @@ def _get_coldkey_ss58_addresses_for_path(path: str) -> Tuple[List[str], List[str
         coldkey_files = []
         wallet_names = []
 
-        for potential_wallet_name in os.listdir(abspath):
-            coldkey_path = os.path.join(
-                abspath, potential_wallet_name, "coldkeypub.txt"
-            )
-            if os.path.isdir(
-                os.path.join(abspath, potential_wallet_name)
-            ) and os.path.exists(coldkey_path):
-                coldkey_files.append(coldkey_path)
-                wallet_names.append(potential_wallet_name)
-            else:
-                bittensor.logging.warning(
-                    f"{coldkey_path} does not exist. Excluding..."
-                )
+        with os.scandir(abspath) as entries:
+            for entry in entries:
+                coldkey_path = os.path.join(entry.path, "coldkeypub.txt")
+                if entry.is_dir() and os.path.exists(coldkey_path):
+                    coldkey_files.append(coldkey_path)
+                    wallet_names.append(entry.name)
+                else:
+                    bittensor.logging.warning(
+                        f"{coldkey_path} does not exist. Excluding..."
+                    )
         return coldkey_files, wallet_names
 
     coldkey_files, wallet_names = list_coldkeypub_files(path)
@@ -26,9 +26,16 @@ import yaml
 import copy
 from copy import deepcopy
 from munch import DefaultMunch
-from typing import List, Optional, Dict, Any, TypeVar, Type
+from typing import List, Optional, Dict, Any, TypeVar, Type, Tuple
 import argparse
 
+try:
+    from yaml import CSafeLoader as _SafeLoader, CDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, Dumper as _Dumper
+
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
 
 class InvalidConfigFile(Exception):
     """In place of YAMLError"""
@@ -131,35 +138,33 @@ class config(DefaultMunch):
                 f"Missing required arguments: {', '.join(missing_required_args)}"
             )
 
-        # 1.1 Optionally load defaults if the --config is set.
-        try:
-            config_file_path = (
-                str(os.getcwd())
-                + "/"
-                + vars(parser.parse_known_args(args)[0])["config"]
-            )
-        except Exception as e:
-            config_file_path = None
-
         # Parse args not strict
         config_params = config.__parse_args__(args=args, parser=parser, strict=False)
 
+        # 1.1 Optionally load defaults if the --config is set.
+        config_file_path = getattr(config_params, "config", None)
+
         # 2. Optionally check for --strict
         ## strict=True when passed in OR when --strict is set
         strict = config_params.strict or strict
 
         if config_file_path != None:
-            config_file_path = os.path.expanduser(config_file_path)
+            # Relative paths are resolved against the working directory.
+            config_file_path = os.path.abspath(os.path.expanduser(config_file_path))
             try:
                 with open(config_file_path) as f:
-                    params_config = yaml.safe_load(f)
+                    params_config = yaml.load(f, Loader=_SafeLoader)
                     print("Loading config defaults from: {}".format(config_file_path))
                     parser.set_defaults(**params_config)
             except Exception as e:
                 print("Error in loading: {} using default parser settings".format(e))
 
         # 2. Continue with loading in params.
-        params = config.__parse_args__(args=args, parser=parser, strict=strict)
+        ## Without a config file or strict parsing the parse above already has the final values.
+        if config_file_path == None and not strict:
+            params = config_params
+        else:
+            params = config.__parse_args__(args=args, parser=parser, strict=strict)
 
         _config = self
 
@@ -169,87 +174,83 @@ class config(DefaultMunch):
         # Make the is_set map
         _config["__is_set"] = {}
 
-        ## Reparse args using default of unset
-        parser_no_defaults = copy.deepcopy(parser)
-
-        # Only command as the arg, else no args
-        default_param_args = (
-            [_config.get("command")]
-            if _config.get("command") != None and _config.get("subcommand") == None
-            else []
-        )
-        if _config.get("command") != None and _config.get("subcommand") != None:
-            default_param_args = [_config.get("command"), _config.get("subcommand")]
-
-        ## Get all args by name
-        default_params = parser.parse_args(args=default_param_args)
-
-        all_default_args = default_params.__dict__.keys() | []
-        ## Make a dict with keys as args and values as argparse.SUPPRESS
-        defaults_as_suppress = {key: argparse.SUPPRESS for key in all_default_args}
-        ## Set the defaults to argparse.SUPPRESS, should remove them from the namespace
-        parser_no_defaults.set_defaults(**defaults_as_suppress)
-        parser_no_defaults._defaults.clear()  # Needed for quirk of argparse
-
-        ### Check for subparsers and do the same
-        if parser_no_defaults._subparsers != None:
-            for action in parser_no_defaults._subparsers._actions:
-                # Should only be the "command" subparser action
-                if isinstance(action, argparse._SubParsersAction):
-                    # Set the defaults to argparse.SUPPRESS, should remove them from the namespace
-                    # Each choice is the keyword for a command, we need to set the defaults for each of these
-                    ## Note: we also need to clear the _defaults dict for each, this is a quirk of argparse
-                    cmd_parser: argparse.ArgumentParser
-                    for cmd_parser in action.choices.values():
-                        # If this choice is also a subparser, set defaults recursively
-                        if cmd_parser._subparsers:
-                            for action in cmd_parser._subparsers._actions:
-                                # Should only be the "command" subparser action
-                                if isinstance(action, argparse._SubParsersAction):
-                                    cmd_parser: argparse.ArgumentParser
-                                    for cmd_parser in action.choices.values():
-                                        cmd_parser.set_defaults(**defaults_as_suppress)
-                                        cmd_parser._defaults.clear()  # Needed for quirk of argparse
-                        else:
-                            cmd_parser.set_defaults(**defaults_as_suppress)
-                            cmd_parser._defaults.clear()  # Needed for quirk of argparse
-
-        ## Reparse the args, but this time with the defaults as argparse.SUPPRESS
-        params_no_defaults = config.__parse_args__(
-            args=args, parser=parser_no_defaults, strict=strict
-        )
+        ## Reparse args using default of unset. The parser and its subparsers are
+        ## suppressed in place and restored afterwards rather than deep copied.
+        snapshot = config._snapshot_defaults(parser)
+        try:
+            for cmd_parser, _, action_defaults in snapshot:
+                # Set every default to argparse.SUPPRESS, should remove them from the namespace
+                for action, _ in action_defaults:
+                    action.default = argparse.SUPPRESS
+                cmd_parser._defaults.clear()  # Needed for quirk of argparse
+
+            ## Reparse the args, but this time with the defaults as argparse.SUPPRESS
+            params_no_defaults = config.__parse_args__(
+                args=args, parser=parser, strict=strict
+            )
+        finally:
+            config._restore_defaults(snapshot)
 
         ## Diff the params and params_no_defaults to get the is_set map
         _config["__is_set"] = {
             arg_key: True
-            for arg_key in [
-                k
-                for k, _ in filter(
-                    lambda kv: kv[1] != argparse.SUPPRESS,
-                    params_no_defaults.__dict__.items(),
-                )
-            ]
+            for arg_key, arg_val in params_no_defaults.__dict__.items()
+            if arg_val != argparse.SUPPRESS
         }
 
+    @staticmethod
+    def _snapshot_defaults(
+        parser: argparse.ArgumentParser,
+    ) -> List[Tuple[argparse.ArgumentParser, Dict[str, Any], List[Tuple[Any, Any]]]]:
+        """Records the defaults of ``parser`` and every nested subparser so they can be restored.
+
+        While the ``is_set`` reparse runs, the defaults of the caller's parser are set to
+        ``argparse.SUPPRESS`` in place. ``config()`` is therefore not reentrant on a shared
+        parser: another thread parsing with the same parser during that window sees the
+        suppressed defaults. Give each thread its own parser.
+        """
+        snapshot = []
+        seen = set()
+        stack = [parser]
+        while stack:
+            cur = stack.pop()
+            # Aliased commands map several names to the same parser.
+            if id(cur) in seen:
+                continue
+            seen.add(id(cur))
+            snapshot.append(
+                (
+                    cur,
+                    dict(cur._defaults),
+                    [(action, action.default) for action in cur._actions],
+                )
+            )
+            if cur._subparsers != None:
+                for action in cur._subparsers._actions:
+                    if isinstance(action, argparse._SubParsersAction):
+                        stack.extend(action.choices.values())
+        return snapshot
+
+    @staticmethod
+    def _restore_defaults(snapshot) -> None:
+        """Restores the defaults recorded by :func:`_snapshot_defaults`."""
+        for cur, parser_defaults, action_defaults in snapshot:
+            cur._defaults = parser_defaults
+            for action, default in action_defaults:
+                action.default = default
+
     @staticmethod
     def __split_params__(params: argparse.Namespace, _config: "config"):
         # Splits params on dot syntax i.e neuron.axon_port and adds to _config
         for arg_key, arg_val in params.__dict__.items():
-            split_keys = arg_key.split(".")
+            *path, leaf = arg_key.split(".")
             head = _config
-            keys = split_keys
-            while len(keys) > 1:
-                if (
-                    hasattr(head, keys[0]) and head[keys[0]] != None
-                ):  # Needs to be Config
-                    head = getattr(head, keys[0])
-                    keys = keys[1:]
-                else:
-                    head[keys[0]] = config()
-                    head = head[keys[0]]
-                    keys = keys[1:]
-            if len(keys) == 1:
-                head[keys[0]] = arg_val
+            for key in path:
+                child = head.get(key)
+                if child == None:  # Needs to be Config
+                    child = head[key] = config()
+                head = child
+            head[leaf] = arg_val
 
     @staticmethod
     def __parse_args__(
@@ -282,16 +283,15 @@ class config(DefaultMunch):
         return params
 
     def __deepcopy__(self, memo) -> "config":
-        _default = self.__default__
-
-        config_state = self.__getstate__()
-        config_copy = config()
+        config_copy = config(default=self.__default__)
         memo[id(self)] = config_copy
 
-        config_copy.__setstate__(config_state)
-        config_copy.__default__ = _default
-
-        config_copy["__is_set"] = deepcopy(self["__is_set"], memo)
+        # Nested sections are copied through this method too; immutable leaves are
+        # shared rather than sent through deepcopy's dispatch.
+        for key, value in self.items():
+            if type(value) not in _IMMUTABLE_TYPES:
+                value = deepcopy(value, memo)
+            config_copy[key] = value
 
         return config_copy
 
@@ -300,58 +300,58 @@ class config(DefaultMunch):
 
     @staticmethod
     def _remove_private_keys(d):
-        if "__parser" in d:
-            d.pop("__parser", None)
-        if "__is_set" in d:
-            d.pop("__is_set", None)
-        for k, v in list(d.items()):
-            if isinstance(v, dict):
+        d.pop("__parser", None)
+        d.pop("__is_set", None)
+        # toDict() output only holds plain dicts, so an exact type check suffices.
+        for v in d.values():
+            if type(v) is dict:
                 config._remove_private_keys(v)
         return d
 
     def __str__(self) -> str:
-        # remove the parser and is_set map from the visible config
-        visible = copy.deepcopy(self.toDict())
-        visible.pop("__parser", None)
-        visible.pop("__is_set", None)
-        cleaned = config._remove_private_keys(visible)
-        return "\n" + yaml.dump(cleaned, sort_keys=False)
+        # remove the parser and is_set map from the visible config.
+        # toDict() already builds fresh dicts, so they can be stripped in place.
+        visible = config._remove_private_keys(self.toDict())
+        return "\n" + yaml.dump(visible, Dumper=_Dumper, sort_keys=False)
 
     def copy(self) -> "config":
         return copy.deepcopy(self)
 
     def to_string(self, items) -> str:
         """Get string from items"""
-        return "\n" + yaml.dump(items.toDict())
+        return "\n" + yaml.dump(items.toDict(), Dumper=_Dumper)
 
     def update_with_kwargs(self, kwargs):
         """Add config to self"""
-        for key, val in kwargs.items():
-            self[key] = val
+        # config does not override __setitem__, so dict.update stores the same values in one call.
+        dict.update(self, kwargs)
 
     @classmethod
     def _merge(cls, a, b):
         """Merge two configurations recursively.
         If there is a conflict, the value from the second configuration will take precedence.
         """
-        for key in b:
-            if key in a:
-                if isinstance(a[key], dict) and isinstance(b[key], dict):
-                    a[key] = cls._merge(a[key], b[key])
+        # Walk nested configs with an explicit stack rather than recursing per level.
+        stack = [(a, b)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                existing = dst.get(key)
+                # Nested sections are config instances, so test with isinstance.
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    stack.append((existing, value))
                 else:
-                    a[key] = b[key]
-            else:
-                a[key] = b[key]
+                    dst[key] = value
         return a
 
     def merge(self, b):
         """
-        Merges the current config with another config.
+        Merges another config into the current config in place.
 
         Args:
             b: Another config to merge.
         """
-        self = self._merge(self, b)
+        type(self)._merge(self, b)
 
     @classmethod
     def merge_all(cls, configs: List["config"]) -> "config":
@@ -385,17 +385,26 @@ class config(DefaultMunch):
         self, parser: argparse.ArgumentParser, args: List[str]
     ) -> List[str]:
         required_args = self.__get_required_args_from_parser(parser)
-        missing_args = [arg for arg in required_args if not any(arg in s for s in args)]
+        # Flags present on the command line, without any ``=value`` suffix.
+        passed_flags = {arg.split("=", 1)[0] for arg in args if arg.startswith("-")}
+        missing_args = [
+            arg
+            for arg, option_strings in required_args.items()
+            if passed_flags.isdisjoint(option_strings)
+        ]
         return missing_args
 
     @staticmethod
-    def __get_required_args_from_parser(parser: argparse.ArgumentParser) -> List[str]:
-        required_args = []
+    def __get_required_args_from_parser(
+        parser: argparse.ArgumentParser,
+    ) -> Dict[str, List[str]]:
+        required_args = {}
         for action in parser._actions:
-            if action.required:
+            # Required positionals have no flag to look for, argparse reports those itself.
+            if action.required and action.option_strings:
                 # Prefix the argument with '--' if it's a long argument, or '-' if it's short
                 prefix = "--" if len(action.dest) > 1 else "-"
-                required_args.append(prefix + action.dest)
+                required_args[prefix + action.dest] = action.option_strings
         return required_args
 
 
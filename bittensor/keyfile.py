@@ -20,6 +20,7 @@ import base64
 import json
 import stat
 import getpass
+import tempfile
 import bittensor
 from bittensor.errors import KeyFileError
 from typing import Optional
@@ -276,12 +277,13 @@ def get_coldkey_password_from_environment(coldkey_name: str) -> Optional[str]:
     Returns:
         password (str): The password retrieved from the environment variables, or ``None`` if not found.
     """
-    envs = {
-        normalized_env_name: env_value
-        for env_name, env_value in os.environ.items()
-        if (normalized_env_name := env_name.upper()).startswith("BT_COLD_PW_")
-    }
-    return envs.get(f"BT_COLD_PW_{coldkey_name.upper()}")
+    env_name = f"BT_COLD_PW_{coldkey_name.upper()}"
+    password = None
+    # Names are matched case-insensitively; as before, the last match wins.
+    for name, value in os.environ.items():
+        if name.upper() == env_name:
+            password = value
+    return password
 
 
 def decrypt_keyfile_data(
@@ -510,8 +512,9 @@ class keyfile:
         Returns:
             may_overwrite (bool): ``True`` if the user allows overwriting the file.
         """
-        choice = input("File {} already exists. Overwrite? (y/N) ".format(self.path))
-        return choice == "y"
+        return Confirm.ask(
+            "File {} already exists. Overwrite?".format(self.path), default=False
+        )
 
     def check_and_update_encryption(
         self, print_result: bool = True, no_prompt: bool = False
@@ -680,16 +683,18 @@ class keyfile:
         Raises:
             KeyFileError: Raised if the file does not exist or is not readable.
         """
-        if not self.exists_on_device():
+        # Open directly and map the failure, rather than stat-ing the path first.
+        try:
+            with open(self.path, "rb") as file:
+                data = file.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             raise bittensor.KeyFileError(
                 "Keyfile at: {} does not exist".format(self.path)
             )
-        if not self.is_readable():
+        except PermissionError:
             raise bittensor.KeyFileError(
                 "Keyfile at: {} is not readable".format(self.path)
             )
-        with open(self.path, "rb") as file:
-            data = file.read()
         return data
 
     def _write_keyfile_data_to_file(self, keyfile_data: bytes, overwrite: bool = False):
@@ -707,8 +712,26 @@ class keyfile:
                 raise bittensor.KeyFileError(
                     "Keyfile at: {} is not writable".format(self.path)
                 )
-        with open(self.path, "wb") as keyfile:
-            keyfile.write(keyfile_data)
+        # Write to a temporary file and atomically move it into place, so an interrupted
+        # write never leaves a truncated keyfile behind.
+        # mkstemp creates a fresh, owner-only file, so it never follows a planted symlink
+        # or collides with a concurrent writer.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(self.path), prefix=os.path.basename(self.path) + "."
+        )
+        try:
+            with os.fdopen(fd, "wb") as keyfile:
+                keyfile.write(keyfile_data)
+                keyfile.flush()
+                os.fsync(keyfile.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            # Do not leave a copy of the key material behind.
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
         # Set file permissions.
         os.chmod(self.path, stat.S_IRUSR | stat.S_IWUSR)
 
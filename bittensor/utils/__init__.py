@@ -23,6 +23,7 @@ import numpy as np
 import scalecodec
 
 import bittensor
+from . import networking  # noqa: F401
 from .registration import torch, use_torch
 from .version import version_checking, check_version, VersionCheckError
 from .wallet_utils import *  # noqa F401
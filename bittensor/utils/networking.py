@@ -20,15 +20,28 @@
 # DEALINGS IN THE SOFTWARE.
 
 # Standard Lib
-import os
+import socket
+import operator
+import functools
 import urllib
-import json
+import urllib.request
+import threading
+import time
 import netaddr
+from typing import Tuple
 
 # 3rd party
 import requests
 
 
+def _inet_pton(str_val: str) -> Tuple[int, bytes]:
+    """Packs an ip-string with the C socket parser, returning its version and bytes."""
+    if "." in str_val and ":" not in str_val:
+        return 4, socket.inet_pton(socket.AF_INET, str_val)
+    return 6, socket.inet_pton(socket.AF_INET6, str_val)
+
+
+@functools.lru_cache(maxsize=4096)
 def int_to_ip(int_val: int) -> str:
     r"""Maps an integer to a unique ip-string
     Args:
@@ -43,9 +56,18 @@ def int_to_ip(int_val: int) -> str:
         netaddr.core.AddrFormatError (Exception):
             Raised when the passed int_vals is not a valid ip int value.
     """
-    return str(netaddr.IPAddress(int_val))
+    try:
+        # operator.index also accepts integer types such as numpy.int64.
+        value = operator.index(int_val)
+        if 0 <= value < 2**32:
+            return socket.inet_ntop(socket.AF_INET, value.to_bytes(4, "big"))
+        return socket.inet_ntop(socket.AF_INET6, value.to_bytes(16, "big"))
+    except (TypeError, ValueError, OverflowError, OSError):
+        # Fall back to netaddr so invalid values raise the documented errors.
+        return str(netaddr.IPAddress(int_val))
 
 
+@functools.lru_cache(maxsize=4096)
 def ip_to_int(str_val: str) -> int:
     r"""Maps an ip-string to a unique integer.
     arg:
@@ -60,9 +82,14 @@ def ip_to_int(str_val: str) -> int:
         netaddr.core.AddrFormatError (Exception):
             Raised when the passed str_val is not a valid ip string value.
     """
-    return int(netaddr.IPAddress(str_val))
+    try:
+        return int.from_bytes(_inet_pton(str_val)[1], "big")
+    except (TypeError, ValueError, OSError):
+        # netaddr also accepts a few non-canonical forms and raises the documented errors.
+        return int(netaddr.IPAddress(str_val))
 
 
+@functools.lru_cache(maxsize=4096)
 def ip_version(str_val: str) -> int:
     r"""Returns the ip version (IPV4 or IPV6).
     arg:
@@ -77,7 +104,10 @@ def ip_version(str_val: str) -> int:
         netaddr.core.AddrFormatError (Exception):
             Raised when the passed str_val is not a valid ip string value.
     """
-    return int(netaddr.IPAddress(str_val).version)
+    try:
+        return _inet_pton(str_val)[0]
+    except (TypeError, ValueError, OSError):
+        return int(netaddr.IPAddress(str_val).version)
 
 
 def ip__str__(ip_type: int, ip_str: str, port: int):
@@ -89,69 +119,101 @@ class ExternalIPNotFound(Exception):
     """Raised if we cannot attain your external ip from CURL/URLLIB/IPIFY/AWS"""
 
 
-def get_external_ip() -> str:
-    r"""Checks CURL/URLLIB/IPIFY/AWS for your external ip.
-    Returns:
-        external_ip  (:obj:`str` `required`):
-            Your routers external facing ip as a string.
+# Seconds each provider request may take before it is abandoned.
+EXTERNAL_IP_TIMEOUT = 2
 
-    Raises:
-        ExternalIPNotFound (Exception):
-            Raised if all external ip attempts fail.
-    """
-    # --- Try AWS
-    try:
-        external_ip = requests.get("https://checkip.amazonaws.com").text.strip()
-        assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
-    except Exception:
-        pass
 
-    # --- Try ipconfig.
-    try:
-        process = os.popen("curl -s ifconfig.me")
-        external_ip = process.readline()
-        process.close()
-        assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
-    except Exception:
-        pass
+def _external_ip_from_aws() -> str:
+    return requests.get(
+        "https://checkip.amazonaws.com", timeout=EXTERNAL_IP_TIMEOUT
+    ).text.strip()
 
-    # --- Try ipinfo.
-    try:
-        process = os.popen("curl -s https://ipinfo.io")
-        external_ip = json.loads(process.read())["ip"]
-        process.close()
-        assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
-    except Exception:
-        pass
 
-    # --- Try myip.dnsomatic
-    try:
-        process = os.popen("curl -s myip.dnsomatic.com")
-        external_ip = process.readline()
-        process.close()
-        assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
-    except Exception:
-        pass
+def _external_ip_from_ifconfig() -> str:
+    return requests.get(
+        "https://ifconfig.me/ip", timeout=EXTERNAL_IP_TIMEOUT
+    ).text.strip()
 
-    # --- Try urllib ipv6
-    try:
-        external_ip = urllib.request.urlopen("https://ident.me").read().decode("utf8")
-        assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
-    except Exception:
-        pass
 
-    # --- Try Wikipedia
+def _external_ip_from_ipinfo() -> str:
+    response = requests.get("https://ipinfo.io/json", timeout=EXTERNAL_IP_TIMEOUT)
+    return response.json()["ip"]
+
+
+def _external_ip_from_dnsomatic() -> str:
+    return requests.get(
+        "https://myip.dnsomatic.com", timeout=EXTERNAL_IP_TIMEOUT
+    ).text.strip()
+
+
+def _external_ip_from_ident() -> str:
+    return (
+        urllib.request.urlopen("https://ident.me", timeout=EXTERNAL_IP_TIMEOUT)
+        .read()
+        .decode("utf8")
+    )
+
+
+def _external_ip_from_wikipedia() -> str:
+    return requests.get(
+        "https://www.wikipedia.org", timeout=EXTERNAL_IP_TIMEOUT
+    ).headers["X-Client-IP"]
+
+
+# Providers in order of preference; the first one with a valid answer is used.
+_EXTERNAL_IP_PROBES = (
+    _external_ip_from_aws,
+    _external_ip_from_ifconfig,
+    _external_ip_from_ipinfo,
+    _external_ip_from_dnsomatic,
+    _external_ip_from_ident,
+    _external_ip_from_wikipedia,
+)
+
+
+def _run_external_ip_probe(probe, results: list, index: int, done: threading.Event):
     try:
-        external_ip = requests.get("https://www.wikipedia.org").headers["X-Client-IP"]
+        external_ip = probe()
         assert isinstance(ip_to_int(external_ip), int)
-        return str(external_ip)
+        results[index] = str(external_ip)
     except Exception:
         pass
+    finally:
+        done.set()
+
+
+def get_external_ip() -> str:
+    r"""Checks AWS/IFCONFIG/IPINFO/DNSOMATIC/IDENT/WIKIPEDIA for your external ip.
+
+    All providers are queried concurrently, but the answer of the highest priority provider
+    that succeeds is returned, so the result does not depend on which one responds first.
+
+    Returns:
+        external_ip  (:obj:`str` `required`):
+            Your routers external facing ip as a string.
+
+    Raises:
+        ExternalIPNotFound (Exception):
+            Raised if all external ip attempts fail.
+    """
+    results = [None] * len(_EXTERNAL_IP_PROBES)
+    events = []
+    for index, probe in enumerate(_EXTERNAL_IP_PROBES):
+        done = threading.Event()
+        # Daemon threads, so a provider that hangs despite the timeout never blocks exit.
+        threading.Thread(
+            target=_run_external_ip_probe,
+            args=(probe, results, index, done),
+            daemon=True,
+        ).start()
+        events.append(done)
+
+    # Requests time out per connect/read phase, so bound the total wait as well.
+    deadline = time.monotonic() + 3 * EXTERNAL_IP_TIMEOUT
+    for index, done in enumerate(events):
+        done.wait(timeout=max(0.0, deadline - time.monotonic()))
+        if results[index] is not None:
+            return results[index]
 
     raise ExternalIPNotFound
 
@@ -167,7 +229,7 @@ def get_formatted_ws_endpoint_url(endpoint_url: str) -> str:
         formatted_endpoint_url (str, `required`):
             The formatted endpoint url. In the form of ws://<endpoint_url> or wss://<endpoint_url>
     """
-    if endpoint_url[0:6] != "wss://" and endpoint_url[0:5] != "ws://":
-        endpoint_url = "ws://{}".format(endpoint_url)
+    if not endpoint_url.startswith(("wss://", "ws://")):
+        endpoint_url = "ws://" + endpoint_url
 
     return endpoint_url
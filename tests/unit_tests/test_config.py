@@ -0,0 +1,199 @@
+"""Tests for bittensor/config module."""
+
+import argparse
+
+import pytest
+
+import bittensor
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "config.yml"
+    path.write_text("wallet.name: from_file\n")
+    return path
+
+
+@pytest.fixture
+def wallet_parser():
+    # Function scoped: config() adds options and file defaults to the parser it is given.
+    parser = argparse.ArgumentParser()
+    bittensor.wallet.add_args(parser)
+    return parser
+
+
+@pytest.mark.parametrize("relative", [False, True])
+def test_config_file_path(config_file, wallet_parser, monkeypatch, relative):
+    # Prep
+    parser = wallet_parser
+    monkeypatch.chdir(config_file.parent)
+    path = config_file.name if relative else str(config_file)
+
+    # Call
+    cfg = bittensor.config(parser, args=["--config", path])
+
+    # Assertions
+    assert cfg.wallet.name == "from_file"
+
+
+def test_config_file_path_expands_user(config_file, wallet_parser, monkeypatch):
+    # Prep
+    parser = wallet_parser
+    monkeypatch.setenv("HOME", str(config_file.parent))
+
+    # Call
+    cfg = bittensor.config(parser, args=["--config", "~/" + config_file.name])
+
+    # Assertions
+    assert cfg.wallet.name == "from_file"
+
+
+def test_str_hides_private_keys():
+    # Prep
+    cfg = bittensor.config()
+    cfg.wallet = bittensor.config()
+    cfg.wallet.name = "default"
+    cfg.netuid = 1
+
+    # Call
+    result = str(cfg)
+
+    # Assertions
+    assert result == "\nwallet:\n  name: default\nnetuid: 1\n"
+    assert "__is_set" in cfg
+    assert "__is_set" in cfg.wallet
+
+
+@pytest.mark.parametrize(
+    "args, missing",
+    [
+        (["--netuid", "1"], []),
+        (["--netuid=1"], []),
+        (["-n", "1"], []),
+        ([], ["--netuid"]),
+        (["--netuid_extra", "1"], ["--netuid"]),
+    ],
+)
+def test_check_for_missing_required_args(args, missing):
+    # Prep
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--netuid", type=int, required=True)
+    parser.add_argument("--netuid_extra", type=int, default=0)
+    parser.add_argument("name")
+
+    # Call
+    result = bittensor.config()._config__check_for_missing_required_args(parser, args)
+
+    # Assertions
+    assert result == missing
+
+
+def test_parser_defaults_restored_after_is_set_reparse(wallet_parser):
+    # Prep
+    parser = wallet_parser
+    subparsers = parser.add_subparsers(dest="command")
+    cmd_parser = subparsers.add_parser("overview")
+    cmd_parser.add_argument("--all", action="store_true", default=False)
+
+    # Call
+    cfg = bittensor.config(parser, args=["--wallet.name", "x", "overview"])
+    again = bittensor.config(parser, args=["overview"])
+
+    # Assertions
+    assert cfg.is_set("wallet.name")
+    assert not cfg.is_set("wallet.hotkey")
+    assert not again.is_set("wallet.name")
+    assert again.wallet.name == "default"
+    assert again.all is False
+    assert parser.get_default("wallet.name") == "default"
+    assert cmd_parser.get_default("all") is False
+
+
+def test_split_params_nests_dotted_keys():
+    # Prep
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--neuron.name", default="miner")
+    parser.add_argument("--neuron.axon.port", type=int, default=8091)
+    parser.add_argument("--neuron.axon.ip", default="[::]")
+    parser.add_argument("--netuid", type=int, default=1)
+
+    # Call
+    cfg = bittensor.config(parser, args=["--neuron.axon.port", "9000"])
+
+    # Assertions
+    assert isinstance(cfg.neuron, bittensor.config)
+    assert isinstance(cfg.neuron.axon, bittensor.config)
+    assert cfg.neuron.name == "miner"
+    assert cfg.neuron.axon.port == 9000
+    assert cfg.neuron.axon.ip == "[::]"
+    assert cfg.netuid == 1
+
+
+def test_config_with_required_option():
+    # Prep
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--netuid", type=int, required=True)
+    parser.add_argument("--neuron.name", default="miner")
+
+    # Call
+    cfg = bittensor.config(parser, args=["--netuid", "2"])
+
+    # Assertions
+    assert cfg.netuid == 2
+    assert cfg.neuron.name == "miner"
+    assert cfg.is_set("netuid")
+    assert not cfg.is_set("neuron.name")
+
+
+@pytest.mark.parametrize("strict_flag", [False, True])
+def test_strict_rejects_unknown_args(strict_flag):
+    # Prep
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--netuid", type=int, default=1)
+    args = ["--netuid", "2", "--unknown"]
+
+    # Call / Assertions
+    if strict_flag:
+        with pytest.raises(SystemExit):
+            bittensor.config(parser, args=args + ["--strict"])
+        with pytest.raises(SystemExit):
+            bittensor.config(parser, args=args, strict=True)
+    else:
+        assert bittensor.config(parser, args=args).netuid == 2
+
+
+def test_merge_all_merges_nested_sections():
+    # Prep
+    first = bittensor.config()
+    first.wallet = bittensor.config()
+    first.wallet.name = "first"
+    first.wallet.hotkey = "hot"
+    second = bittensor.config()
+    second.wallet = bittensor.config()
+    second.wallet.name = "second"
+    second.netuid = 3
+
+    # Call
+    merged = bittensor.config.merge_all([first, second])
+
+    # Assertions
+    assert merged.wallet.name == "second"
+    assert merged.wallet.hotkey == "hot"
+    assert merged.netuid == 3
+
+
+def test_copy_does_not_share_nested_sections(wallet_parser):
+    # Prep
+    parser = wallet_parser
+    cfg = bittensor.config(parser, args=["--wallet.name", "original"])
+
+    # Call
+    copied = cfg.copy()
+    copied.wallet.name = "changed"
+    copied["__is_set"]["wallet.hotkey"] = True
+
+    # Assertions
+    assert isinstance(copied.wallet, bittensor.config)
+    assert cfg.wallet.name == "original"
+    assert cfg.is_set("wallet.name") and copied.is_set("wallet.name")
+    assert not cfg.is_set("wallet.hotkey")
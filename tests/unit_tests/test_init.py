@@ -0,0 +1,80 @@
+"""Tests for bittensor/__init__ module."""
+
+import ast
+import importlib
+import inspect
+
+import pytest
+
+import bittensor
+
+
+@pytest.mark.parametrize("name", sorted(bittensor._LAZY))
+def test_lazy_attribute_resolves(name):
+    module_name, attr = bittensor._LAZY[name]
+    module = importlib.import_module(module_name)
+    expected = module if attr is None else getattr(module, attr)
+
+    assert getattr(bittensor, name) is expected
+
+
+def test_submodule_import_does_not_shadow_export():
+    # Prep
+    import bittensor.axon  # noqa: F401
+    from bittensor.axon import axon
+
+    # Assertions
+    assert bittensor.axon is axon
+    assert bittensor.subtensor is bittensor.Subtensor
+    assert bittensor.subtensor_module.Subtensor is bittensor.Subtensor
+
+
+def test_dir_lists_lazy_attributes():
+    assert set(bittensor._LAZY) <= set(dir(bittensor))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        bittensor.does_not_exist
+
+
+def test_defaults_built_on_first_access():
+    defaults = bittensor.defaults
+
+    assert defaults.wallet.name == bittensor.wallet.config().wallet.name
+    assert defaults.axon.port == bittensor.axon.config().axon.port
+    assert bittensor.defaults is defaults
+
+
+def test_star_import_exports_lazy_attributes():
+    # Prep
+    namespace = {}
+
+    # Call
+    exec("from bittensor import *", namespace)
+
+    # Assertions
+    assert set(bittensor._LAZY) | {"configs", "defaults"} <= set(namespace)
+    assert namespace["wallet"] is bittensor.wallet
+    assert namespace["Keypair"] is bittensor.Keypair
+
+
+def test_type_checking_imports_match_lazy_exports():
+    # Prep
+    tree = ast.parse(inspect.getsource(bittensor))
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "typing.TYPE_CHECKING"
+    )
+
+    # Call
+    names = set()
+    for node in block.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            names.update(alias.asname or alias.name for alias in node.names)
+        elif isinstance(node, ast.AnnAssign):
+            names.add(node.target.id)
+
+    # Assertions
+    assert names == set(bittensor._LAZY) | {"configs", "defaults"}
@@ -553,6 +553,54 @@ def test_overwriting(keyfile_setup_teardown):
             )
 
 
+def test_write_keyfile_is_atomic(keyfile_setup_teardown):
+    """
+    Test case for writing a keyfile through a temporary file that is moved into place.
+    """
+    root_path = keyfile_setup_teardown
+    keyfile = bittensor.keyfile(path=os.path.join(root_path, "atomic_keyfile"))
+    alice = bittensor.Keypair.create_from_uri("/Alice")
+
+    with mock.patch("os.replace", wraps=os.replace) as mock_replace:
+        keyfile.set_keypair(alice, encrypt=False, overwrite=True)
+
+    mock_replace.assert_called_once()
+    tmp_path, dst = mock_replace.call_args.args
+    assert os.path.dirname(tmp_path) == root_path
+    assert dst == keyfile.path
+    assert not [f for f in os.listdir(root_path) if f.startswith("atomic_keyfile.")]
+    assert os.stat(keyfile.path).st_mode & 0o777 == 0o600
+    assert keyfile.get_keypair().ss58_address == alice.ss58_address
+
+
+def test_write_keyfile_removes_temp_file_on_failure(keyfile_setup_teardown):
+    """
+    Test case for cleaning up the temporary file when moving it into place fails.
+    """
+    root_path = keyfile_setup_teardown
+    keyfile = bittensor.keyfile(path=os.path.join(root_path, "failed_keyfile"))
+    alice = bittensor.Keypair.create_from_uri("/Alice")
+
+    with mock.patch("os.replace", side_effect=OSError("replace failed")):
+        with pytest.raises(OSError):
+            keyfile.set_keypair(alice, encrypt=False, overwrite=True)
+
+    assert not [f for f in os.listdir(root_path) if f.startswith("failed_keyfile")]
+
+
+def test_read_missing_keyfile_raises(keyfile_setup_teardown):
+    """
+    Test case for reading a keyfile that does not exist or is a directory.
+    """
+    root_path = keyfile_setup_teardown
+    missing = bittensor.keyfile(path=os.path.join(root_path, "missing_keyfile"))
+    directory = bittensor.keyfile(path=root_path)
+
+    for keyfile in (missing, directory):
+        with pytest.raises(bittensor.KeyFileError, match="does not exist"):
+            keyfile._read_keyfile_data_from_file()
+
+
 def test_serialized_keypair_to_keyfile_data(keyfile_setup_teardown):
     """
     Test case for serializing a keypair to keyfile data.
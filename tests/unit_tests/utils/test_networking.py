@@ -1,5 +1,8 @@
-import os
+import time
 import urllib
+import urllib.error
+import urllib.request
+import numpy as np
 import pytest
 import requests
 import unittest.mock as mock
@@ -82,52 +85,72 @@ def test_int_to_ip6_underflow():
         utils.networking.int_to_ip(underflow)
 
 
+def test_int_to_ip_numpy_integers():
+    """Test converting numpy integers to IPv4 and IPv6 addresses."""
+    assert utils.networking.int_to_ip(np.int64(4294967295)) == "255.255.255.255"
+    assert utils.networking.int_to_ip(np.uint64(4294967296)) == "::1:0:0"
+
+
 # Test getting external IP address
 def test_get_external_ip():
     """Test getting the external IP address."""
     assert utils.networking.get_external_ip()
 
 
-def test_get_external_ip_os_broken():
-    """Test getting the external IP address when os.popen is broken."""
+def test_get_external_ip_requests_broken():
+    """Test getting the external IP address when requests.get is broken."""
+    response = MagicMock()
+    response.read.return_value = b"1.2.3.4"
+
+    with mock.patch.object(
+        requests, "get", side_effect=requests.exceptions.ConnectionError()
+    ):
+        with mock.patch.object(urllib.request, "urlopen", return_value=response):
+            assert utils.networking.get_external_ip() == "1.2.3.4"
 
-    class FakeReadline:
-        def readline(self):
-            return 1
 
-    def mock_call():
-        return FakeReadline()
+def test_get_external_ip_requests_urllib_broken():
+    """Test getting the external IP address when requests.get and urllib.request are broken."""
+    with mock.patch.object(
+        requests, "get", side_effect=requests.exceptions.ConnectionError()
+    ):
+        with mock.patch.object(
+            urllib.request, "urlopen", side_effect=urllib.error.URLError("down")
+        ):
+            with pytest.raises(utils.networking.ExternalIPNotFound):
+                utils.networking.get_external_ip()
 
-    with mock.patch.object(os, "popen", new=mock_call):
-        assert utils.networking.get_external_ip()
 
+def test_get_external_ip_prefers_provider_order(monkeypatch):
+    """Test that a slower higher priority provider wins over a faster later one."""
 
-def test_get_external_ip_os_request_urllib_broken():
-    """Test getting the external IP address when os.popen and requests.get/urllib.request are broken."""
+    def slow_ipv4():
+        time.sleep(0.2)
+        return "1.2.3.4"
 
-    class FakeReadline:
-        def readline(self):
-            return 1
+    def fast_ipv6():
+        return "2001:db8::1"
 
-    def mock_call():
-        return FakeReadline()
+    monkeypatch.setattr(utils.networking, "_EXTERNAL_IP_PROBES", (slow_ipv4, fast_ipv6))
+    assert utils.networking.get_external_ip() == "1.2.3.4"
 
-    class FakeResponse:
-        def text(self):
-            return 1
 
-    def mock_call_two():
-        return FakeResponse()
+def test_get_external_ip_skips_failed_providers(monkeypatch):
+    """Test that failing and invalid providers fall through to the next one."""
 
-    class FakeRequest:
-        def urlopen(self):
-            return 1
+    def broken():
+        raise requests.exceptions.Timeout()
 
-    with mock.patch.object(os, "popen", new=mock_call):
-        with mock.patch.object(requests, "get", new=mock_call_two):
-            urllib.request = MagicMock(return_value=FakeRequest())
-            with pytest.raises(Exception):
-                assert utils.networking.get_external_ip()
+    def invalid():
+        return "not an ip"
+
+    def valid():
+        return "1.2.3.4"
+
+    monkeypatch.setattr(
+        utils.networking, "_EXTERNAL_IP_PROBES", (broken, invalid, valid)
+    )
+    assert utils.networking.get_external_ip() == "1.2.3.4"
 
 
 # Test formatting WebSocket endpoint URL